@@ -13,66 +13,96 @@ import json
 from pathlib import Path
 from typing import Any
 
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json works everywhere
+    orjson = None
+
 CONFIG_DIR = Path.home() / ".config" / "claw-face"
 COMMAND_FILE = CONFIG_DIR / "command.json"
 STATUS_FILE = CONFIG_DIR / "status.txt"
 
-VALID_EXPRESSIONS = {
-    # Canonical (OLED eye presets)
-    "normal",
-    "happy",
-    "sad",
-    "angry",
-    "surprised",
-    "suspicious",
-    "cute",
-    "tired",
-    "wonder",
-    "upset",
-    "confused",
-    "scared",
-    "sleepy",
-    "glee",
-    "skeptic",
-    # Compat aliases (mapped client-side)
-    "neutral",
-    "love",
-    "focused",
-    "thinking",
-    "excited",
-    "glitch",
-    "smug",
-    "sleep",
-    "wink",
-    "talking",
-    "typing",
-}
+VALID_EXPRESSIONS = frozenset(
+    {
+        # Canonical (OLED eye presets)
+        "normal",
+        "happy",
+        "sad",
+        "angry",
+        "surprised",
+        "suspicious",
+        "cute",
+        "tired",
+        "wonder",
+        "upset",
+        "confused",
+        "scared",
+        "sleepy",
+        "glee",
+        "skeptic",
+        # Compat aliases (mapped client-side)
+        "neutral",
+        "love",
+        "focused",
+        "thinking",
+        "excited",
+        "glitch",
+        "smug",
+        "sleep",
+        "wink",
+        "talking",
+        "typing",
+    }
+)
+
+_TRUE = frozenset({"1", "true", "t", "yes", "y", "on"})
+_FALSE = frozenset({"0", "false", "f", "no", "n", "off"})
 
 
 def _parse_bool(s: str) -> bool:
-    v = s.strip().lower()
-    if v in {"1", "true", "t", "yes", "y", "on"}:
+    v = s.strip().casefold()
+    if v in _TRUE:
         return True
-    if v in {"0", "false", "f", "no", "n", "off"}:
+    if v in _FALSE:
         return False
     raise argparse.ArgumentTypeError(f"Invalid boolean: {s!r} (use true/false)")
 
 
 def _load_json(path: Path) -> dict[str, Any]:
     try:
-        raw = path.read_text(encoding="utf-8").strip()
-        if not raw:
+        raw = path.read_bytes()
+        if not raw.strip():
             return {}
-        data = json.loads(raw)
+        # Both parsers accept bytes and surrounding whitespace.
+        data = None
+        if orjson is not None:
+            try:
+                data = orjson.loads(raw)
+            except orjson.JSONDecodeError:  # e.g. NaN, which stdlib json accepts
+                pass
+        if data is None:
+            data = json.loads(raw)
         return data if isinstance(data, dict) else {}
     except FileNotFoundError:
         return {}
-    except json.JSONDecodeError:
+    except ValueError:  # JSONDecodeError (json and orjson) or bad UTF-8
         return {}
     except OSError:
         return {}
 
 
+def _dump_json(data: dict[str, Any]) -> bytes:
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                data,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS | orjson.OPT_APPEND_NEWLINE,
+            )
+        except TypeError:  # e.g. integers wider than 64 bits from another producer
+            pass
+    return (json.dumps(data, indent=2, sort_keys=True) + "\n").encode("utf-8")
+
+
 def main() -> int:
     ap = argparse.ArgumentParser(description="Control the Claw Face kiosk display.")
     ap.add_argument("--expression", type=str, default=None, help="Expression name")
@@ -125,7 +155,7 @@ def main() -> int:
         cmd["auto_cycle"] = bool(args.auto_cycle)
 
     try:
-        COMMAND_FILE.write_text(json.dumps(cmd, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+        COMMAND_FILE.write_bytes(_dump_json(cmd))
     except OSError:
         pass
 
@@ -134,4 +164,3 @@ def main() -> int:
 
 if __name__ == "__main__":
     raise SystemExit(main())
-
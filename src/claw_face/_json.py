@@ -0,0 +1,33 @@
+"""JSON helpers: orjson when installed, stdlib json otherwise.
+
+orjson is stricter than stdlib json on both ends (no NaN/Infinity literals,
+no integers wider than 64 bits), so either call retries with stdlib json
+when orjson refuses its input.
+"""
+
+import json
+
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json works everywhere
+    orjson = None
+
+
+def loads(raw: bytes):
+    """Parse JSON bytes."""
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(raw)
+
+
+def dumps(obj, *, indent: bool = False) -> bytes:
+    """Serialize obj to JSON bytes, compact or with a 2-space indent."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+        except TypeError:
+            pass
+    return json.dumps(obj, indent=2 if indent else None).encode()
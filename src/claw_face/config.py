@@ -1,11 +1,14 @@
 """Configuration management for Claw Face."""
 
-import json
 import logging
-from dataclasses import asdict, dataclass, field, fields
+import math
+import os
+from dataclasses import dataclass, field, fields, replace
 from pathlib import Path
 from typing import Tuple
 
+from . import _json
+
 # Default config location
 CONFIG_DIR = Path.home() / ".config" / "claw-face"
 CONFIG_FILE = CONFIG_DIR / "config.json"
@@ -13,7 +16,7 @@ CONFIG_FILE = CONFIG_DIR / "config.json"
 log = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class Colors:
     """Color configuration (RGB tuples) - OLED eye style."""
 
@@ -24,21 +27,22 @@ class Colors:
     def _clamp_rgb(v: object, fallback: Tuple[int, int, int]) -> Tuple[int, int, int]:
         if not isinstance(v, tuple) or len(v) != 3:
             return fallback
-        out = []
-        for c in v:
-            try:
-                n = int(c)
-            except Exception:
-                return fallback
-            out.append(max(0, min(255, n)))
-        return (out[0], out[1], out[2])
+        try:
+            r, g, b = int(v[0]), int(v[1]), int(v[2])
+        except Exception:
+            return fallback
+        return (
+            0 if r < 0 else 255 if r > 255 else r,
+            0 if g < 0 else 255 if g > 255 else g,
+            0 if b < 0 else 255 if b > 255 else b,
+        )
 
     def validate(self) -> None:
         self.background = self._clamp_rgb(self.background, (0, 0, 0))
         self.eye_color = self._clamp_rgb(self.eye_color, (0, 184, 255))
 
 
-@dataclass
+@dataclass(slots=True)
 class Behavior:
     """Behavior timing configuration."""
 
@@ -55,29 +59,30 @@ class Behavior:
             n = float(v)  # type: ignore[arg-type]
         except Exception:
             return fallback
-        if not (n == n):  # NaN
+        if not math.isfinite(n):  # NaN/inf; orjson would also save inf as null
             return fallback
-        return max(0.0, n)
+        return n if n > 0.0 else 0.0
 
     def validate(self) -> None:
-        self.blink_interval_min = self._clamp_nonneg_float(self.blink_interval_min, 3.0)
-        self.blink_interval_max = self._clamp_nonneg_float(self.blink_interval_max, 6.0)
+        clamp = self._clamp_nonneg_float
+        self.blink_interval_min = clamp(self.blink_interval_min, 3.0)
+        self.blink_interval_max = clamp(self.blink_interval_max, 6.0)
         if self.blink_interval_max < self.blink_interval_min:
             self.blink_interval_min, self.blink_interval_max = (
                 self.blink_interval_max,
                 self.blink_interval_min,
             )
 
-        self.look_interval_min = self._clamp_nonneg_float(self.look_interval_min, 2.0)
-        self.look_interval_max = self._clamp_nonneg_float(self.look_interval_max, 5.0)
+        self.look_interval_min = clamp(self.look_interval_min, 2.0)
+        self.look_interval_max = clamp(self.look_interval_max, 5.0)
         if self.look_interval_max < self.look_interval_min:
             self.look_interval_min, self.look_interval_max = (
                 self.look_interval_max,
                 self.look_interval_min,
             )
 
-        self.expression_interval_min = self._clamp_nonneg_float(self.expression_interval_min, 8.0)
-        self.expression_interval_max = self._clamp_nonneg_float(self.expression_interval_max, 20.0)
+        self.expression_interval_min = clamp(self.expression_interval_min, 8.0)
+        self.expression_interval_max = clamp(self.expression_interval_max, 20.0)
         if self.expression_interval_max < self.expression_interval_min:
             self.expression_interval_min, self.expression_interval_max = (
                 self.expression_interval_max,
@@ -85,7 +90,7 @@ class Behavior:
             )
 
 
-@dataclass
+@dataclass(slots=True)
 class Display:
     """Display / server configuration."""
 
@@ -96,44 +101,61 @@ class Display:
     window_width: int = 1280
     window_height: int = 720
 
+    @staticmethod
+    def _as_int(v: object, fallback: int) -> int:
+        try:
+            return int(v)  # type: ignore[call-overload]
+        except Exception:
+            return fallback
+
     def validate(self) -> None:
         # Host: leave as-is (string); server binding will handle errors.
+        as_int = self._as_int
 
         # Port: allow 0 for ephemeral.
-        try:
-            p = int(self.port)
-        except Exception:
-            p = 8420
-        if p < 0 or p > 65535:
-            p = 8420
-        self.port = p
+        p = as_int(self.port, 8420)
+        self.port = p if 0 <= p <= 65535 else 8420
 
         # FPS: clamp to a sensible range.
-        try:
-            fps = int(self.fps)
-        except Exception:
-            fps = 30
-        self.fps = max(1, min(240, fps))
+        fps = as_int(self.fps, 30)
+        self.fps = 1 if fps < 1 else 240 if fps > 240 else fps
 
         # Window sizes.
-        try:
-            w = int(self.window_width)
-        except Exception:
-            w = 1280
-        try:
-            h = int(self.window_height)
-        except Exception:
-            h = 720
-        self.window_width = max(1, w)
-        self.window_height = max(1, h)
+        w = as_int(self.window_width, 1280)
+        h = as_int(self.window_height, 720)
+        self.window_width = w if w > 1 else 1
+        self.window_height = h if h > 1 else 1
+
+
+# Field names per config section, computed once instead of on every load/save.
+_FIELD_ORDER: dict[type, tuple[str, ...]] = {
+    cls: tuple(f.name for f in fields(cls)) for cls in (Colors, Behavior, Display)
+}
+_FIELD_NAMES: dict[type, frozenset[str]] = {
+    cls: frozenset(names) for cls, names in _FIELD_ORDER.items()
+}
 
 
 def _safe_init(cls, data: dict):
     """Instantiate a dataclass, ignoring unknown keys."""
-    valid = {f.name for f in fields(cls)}
+    valid = _FIELD_NAMES[cls]
     return cls(**{k: v for k, v in data.items() if k in valid})
 
 
+def _to_dict(obj) -> dict:
+    """Shallow field dict of a config section (fields are all immutable values)."""
+    return {name: getattr(obj, name) for name in _FIELD_ORDER[type(obj)]}
+
+
+# Parsed configs keyed by (class, path); reused while the file's (mtime_ns, size) is unchanged.
+_LOAD_CACHE: dict[tuple[type, Path], tuple[int, int, "Config"]] = {}
+
+
+def clear_load_cache() -> None:
+    """Forget all memoized Config.load() results."""
+    _LOAD_CACHE.clear()
+
+
 @dataclass
 class Config:
     """Main configuration container."""
@@ -147,33 +169,59 @@ class Config:
         self.behavior.validate()
         self.display.validate()
 
-    def save(self, path: Path = CONFIG_FILE) -> None:
-        """Save configuration to JSON file."""
-        path.parent.mkdir(parents=True, exist_ok=True)
-
-        self.validate()
-        data = {
+    def copy(self) -> "Config":
+        """Return a copy whose sections can be mutated independently."""
+        return replace(
+            self,
+            colors=replace(self.colors),
+            behavior=replace(self.behavior),
+            display=replace(self.display),
+        )
+
+    def to_dict(self) -> dict:
+        """Return a JSON-ready dict of all sections (color tuples become lists)."""
+        return {
             "colors": {
-                k: list(v) if isinstance(v, tuple) else v for k, v in asdict(self.colors).items()
+                k: list(v) if isinstance(v, tuple) else v for k, v in _to_dict(self.colors).items()
             },
-            "behavior": asdict(self.behavior),
-            "display": asdict(self.display),
+            "behavior": _to_dict(self.behavior),
+            "display": _to_dict(self.display),
         }
 
-        with open(path, "w") as f:
-            json.dump(data, f, indent=2)
+    def save(self, path: Path = CONFIG_FILE, *, validate: bool = True) -> None:
+        """Save configuration to JSON file.
+
+        Pass ``validate=False`` when the config is known to be clean (e.g. fresh
+        defaults or straight out of ``load()``) to skip re-clamping every field.
+        """
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        if validate:
+            self.validate()
+        data = self.to_dict()
+
+        path.write_bytes(_json.dumps(data, indent=True))
+
+        # Let the next load() re-parse the file: the in-memory config need not
+        # survive serialization unchanged, and cache hits must match a fresh parse.
+        _LOAD_CACHE.pop((type(self), path), None)
 
     @classmethod
     def load(cls, path: Path = CONFIG_FILE) -> "Config":
-        """Load configuration from JSON file, or return defaults."""
-        if not path.exists():
-            cfg = cls()
-            cfg.validate()
-            return cfg
+        """Load configuration from JSON file, or return defaults.
 
+        Results are memoized per path and reused until the file's mtime or size
+        changes; callers always receive a fresh copy they are free to mutate.
+        """
+        key = (cls, path)
         try:
-            with open(path) as f:
-                data = json.load(f)
+            st = os.stat(path)
+            cached = _LOAD_CACHE.get(key)
+            if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+                return cached[2].copy()
+
+            raw = path.read_bytes()
+            data = _json.loads(raw)
 
             colors = _safe_init(
                 Colors,
@@ -187,12 +235,16 @@ class Config:
 
             cfg = cls(colors=colors, behavior=behavior, display=display)
             cfg.validate()
-            return cfg
+            _LOAD_CACHE[key] = (st.st_mtime_ns, st.st_size, cfg)
+            return cfg.copy()
+        except FileNotFoundError:
+            pass  # No config yet: defaults are expected, not worth a warning.
         except Exception as e:
             log.warning("Could not load config (%s): %s", str(path), e)
-            cfg = cls()
-            cfg.validate()
-            return cfg
+
+        cfg = cls()
+        cfg.validate()
+        return cfg
 
 
 def get_config() -> Config:
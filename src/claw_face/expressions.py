@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
+from types import MappingProxyType
+
 # The 16 canonical expression names (matching PRESETS in index.html)
-CANONICAL: list[str] = [
+CANONICAL: tuple[str, ...] = (
     "normal",
     "happy",
     "sad",
@@ -20,41 +23,45 @@ CANONICAL: list[str] = [
     "glee",
     "skeptic",
     "thinking",
-]
+)
 
 # Backward-compat aliases → canonical name
-COMPAT_MAP: dict[str, str] = {
-    "neutral": "normal",
-    "love": "cute",
-    "focused": "suspicious",
-    "excited": "glee",
-    "glitch": "scared",
-    "smug": "skeptic",
-    "sleep": "sleepy",
-}
+COMPAT_MAP: Mapping[str, str] = MappingProxyType(
+    {
+        "neutral": "normal",
+        "love": "cute",
+        "focused": "suspicious",
+        "excited": "glee",
+        "glitch": "scared",
+        "smug": "skeptic",
+        "sleep": "sleepy",
+    }
+)
 
 # Special names handled by custom logic (not presets)
-SPECIAL: list[str] = ["wink", "talking", "typing"]
+SPECIAL: tuple[str, ...] = ("wink", "talking", "typing")
 
 # Weighted random distribution for auto-cycling
-WEIGHTS: dict[str, int] = {
-    "normal": 25,
-    "happy": 35,
-    "sad": 5,
-    "angry": 3,
-    "surprised": 8,
-    "suspicious": 6,
-    "cute": 6,
-    "tired": 4,
-    "wonder": 5,
-    "upset": 3,
-    "confused": 3,
-    "scared": 1,
-    "sleepy": 12,
-    "glee": 4,
-    "skeptic": 6,
-    "thinking": 8,
-}
+WEIGHTS: Mapping[str, int] = MappingProxyType(
+    {
+        "normal": 25,
+        "happy": 35,
+        "sad": 5,
+        "angry": 3,
+        "surprised": 8,
+        "suspicious": 6,
+        "cute": 6,
+        "tired": 4,
+        "wonder": 5,
+        "upset": 3,
+        "confused": 3,
+        "scared": 1,
+        "sleepy": 12,
+        "glee": 4,
+        "skeptic": 6,
+        "thinking": 8,
+    }
+)
 
 # Union of all valid expression names
-ALL_VALID: set[str] = set(CANONICAL) | set(COMPAT_MAP) | set(SPECIAL)
+ALL_VALID: frozenset[str] = frozenset(CANONICAL).union(COMPAT_MAP, SPECIAL)
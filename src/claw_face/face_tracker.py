@@ -4,23 +4,25 @@ Uses the webcam to detect faces and sends gaze coordinates to Claw Face
 via the command.json file, making the eyes follow nearby people.
 
 Usage:
-    python -m claw_face.face_tracker [--device 0] [--interval 0.15]
+    python -m claw_face.face_tracker [--device 0] [--interval 0.15] [--model yunet.onnx]
 """
 
 from __future__ import annotations
 
 import argparse
-import json
 import os
 import random
 import signal
 import sys
 import tempfile
+import threading
 import time
 from pathlib import Path
 
 import cv2
 
+from . import _json
+
 
 def get_command_path() -> Path:
     """Return the path to the Claw Face command.json file."""
@@ -32,6 +34,9 @@ def get_status_path() -> Path:
     return Path.home() / ".config" / "claw-face" / "status.txt"
 
 
+# Seconds between captures once no one has been seen for a while
+IDLE_INTERVAL = 0.5
+
 # Greeting messages when a face is detected
 GREETINGS = [
     "Hi! I see you!",
@@ -43,12 +48,14 @@ GREETINGS = [
 ]
 
 
-def atomic_write(path: Path, data: str) -> None:
+def atomic_write(path: Path, data: bytes | str) -> None:
     """Write data to file atomically."""
+    if isinstance(data, str):
+        data = data.encode()
     path.parent.mkdir(parents=True, exist_ok=True)
     fd, tmp = tempfile.mkstemp(dir=str(path.parent), suffix=".tmp")
     try:
-        os.write(fd, data.encode())
+        os.write(fd, data)
         os.close(fd)
         os.replace(tmp, str(path))
     except Exception:
@@ -60,26 +67,62 @@ def atomic_write(path: Path, data: str) -> None:
         raise
 
 
+# path -> ((st_ino, st_mtime_ns, st_size), parsed command) of the last read/write.
+# Writers replace the file atomically (new inode), so a coarse mtime alone can't
+# hide a same-size rewrite.
+_command_cache: dict[Path, tuple[tuple[int, int, int], dict]] = {}
+
+
+def _stat_key(path: Path) -> tuple[int, int, int]:
+    st = os.stat(path)
+    return st.st_ino, st.st_mtime_ns, st.st_size
+
+
 def read_current_command(path: Path) -> dict:
-    """Read current command.json, return empty dict on failure."""
+    """Read current command.json, return empty dict on failure.
+
+    The parsed result is reused until the file changes on disk; callers must
+    treat it as read-only (write_look/clear_look copy before editing).
+    """
     try:
-        return json.loads(path.read_text())
+        key = _stat_key(path)
+        cached = _command_cache.get(path)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        raw = path.read_bytes()
+        data = _json.loads(raw)
     except Exception:
         return {}
+    _command_cache[path] = (key, data)
+    return data
+
+
+def _write_command(path: Path, cmd: dict) -> None:
+    """Atomically write cmd and remember it so the next read skips the parse."""
+    atomic_write(path, dump_command(cmd))
+    try:
+        _command_cache[path] = (_stat_key(path), cmd)
+    except OSError:
+        _command_cache.pop(path, None)
+
+
+def dump_command(cmd: dict) -> bytes:
+    """Serialize a command dict the way command.json is written (indent 2 + newline)."""
+    return _json.dumps(cmd, indent=True) + b"\n"
 
 
 def write_look(path: Path, x: float, y: float, current_cmd: dict) -> None:
     """Update command.json with look override, preserving other fields."""
     cmd = dict(current_cmd)
     cmd["look"] = {"x": round(x, 3), "y": round(y, 3)}
-    atomic_write(path, json.dumps(cmd, indent=2) + "\n")
+    _write_command(path, cmd)
 
 
 def clear_look(path: Path, current_cmd: dict) -> None:
     """Remove look override from command.json."""
     cmd = dict(current_cmd)
     cmd.pop("look", None)
-    atomic_write(path, json.dumps(cmd, indent=2) + "\n")
+    _write_command(path, cmd)
 
 
 def write_status(path: Path, text: str) -> None:
@@ -124,26 +167,142 @@ def map_face_to_gaze(face_cx: float, face_cy: float,
     return gaze_x, gaze_y
 
 
+def detect_cascades(cascades: list, gray, min_size: tuple[int, int],
+                    max_size: tuple[int, int]):
+    """Run face cascades in order and return the first non-empty result.
+
+    scaleFactor 1.2 needs about half the pyramid levels of 1.1; the bounded
+    min/max sizes keep the remaining levels inside the useful face range.
+    """
+    for _name, cascade in cascades:
+        faces = cascade.detectMultiScale(
+            gray,
+            scaleFactor=1.2,
+            minNeighbors=3,
+            minSize=min_size,
+            maxSize=max_size,
+            flags=cv2.CASCADE_SCALE_IMAGE,
+        )
+        if len(faces) > 0:
+            return faces
+    return []
+
+
+def roi_around(box, pad: float, frame_w: int,
+               frame_h: int) -> tuple[int, int, int, int]:
+    """Return (x0, y0, x1, y1) of a box grown by `pad` of its size, clipped to the frame."""
+    x, y, bw, bh = box
+    px, py = int(bw * pad), int(bh * pad)
+    return (max(0, x - px), max(0, y - py),
+            min(frame_w, x + bw + px), min(frame_h, y + bh + py))
+
+
+class FrameGrabber:
+    """Drain the camera on a background thread so every read is fresh.
+
+    The thread calls cap.grab() continuously (no decode), so the driver's
+    buffer queue never hands us a frame that went stale while we were
+    detecting or sleeping. A frame is decoded with cap.retrieve() only when
+    read() asks for one; both calls stay on the grabber thread.
+
+    While idle (see set_idle) the thread stops grabbing and waits for the
+    next read(), then flushes the frames the driver queued in the meantime.
+    """
+
+    FLUSH_FRAMES = 4  # typical V4L2 buffer depth
+
+    def __init__(self, cap) -> None:
+        self._cap = cap
+        self._want = threading.Event()
+        self._ready = threading.Event()
+        self._result = (False, None)
+        self._running = True
+        self._idle = False
+        self._thread = threading.Thread(target=self._run, name="frame-grabber", daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        while self._running:
+            if self._idle:
+                self._want.wait()
+                if not self._running:
+                    break
+                for _ in range(self.FLUSH_FRAMES - 1):
+                    self._cap.grab()  # drop stale frames queued while paused
+            ok = self._cap.grab()
+            if self._want.is_set():
+                self._want.clear()
+                self._result = self._cap.retrieve() if ok else (False, None)
+                self._ready.set()
+            if not ok:
+                time.sleep(0.05)  # camera gone or not ready; don't spin
+
+    def read(self, timeout: float = 1.0):
+        """Return (ok, frame) for the next grabbed frame, like cap.read()."""
+        self._ready.clear()
+        self._want.set()
+        if not self._ready.wait(timeout):
+            return False, None
+        return self._result
+
+    def set_idle(self, idle: bool) -> None:
+        """Pause continuous grabbing between reads (True) or resume it (False)."""
+        self._idle = idle
+
+    def stop(self) -> None:
+        self._running = False
+        self._want.set()  # wake an idle thread so it can exit
+        self._thread.join(timeout=1.0)
+
+
+def load_yunet(model: str):
+    """Load a YuNet ONNX face detector, or return None if unavailable.
+
+    One DNN forward pass covers all scales and poses, replacing the chain of
+    Haar cascades below. Needs OpenCV >= 4.5.4 (cv2.FaceDetectorYN).
+    """
+    if not hasattr(cv2, "FaceDetectorYN"):
+        print("WARNING: OpenCV has no FaceDetectorYN; using Haar cascades", file=sys.stderr)
+        return None
+    try:
+        # Input size is a placeholder; it is set from the first frame.
+        return cv2.FaceDetectorYN.create(model, "", (320, 240), 0.6, 0.3, 5)
+    except cv2.error as e:
+        print(f"WARNING: Could not load YuNet model {model!r} ({e}); "
+              "using Haar cascades", file=sys.stderr)
+        return None
+
+
 def run_tracker(device: int = 0, interval: float = 0.15,
-                 scale: float = 0.3) -> None:
+                 scale: float = 0.3, model: str | None = None) -> None:
     """Main tracking loop."""
-    # Primary: face detection (multiple cascades for robustness)
+    # Optional: YuNet DNN detector (single pass, more robust than cascades)
+    detector = load_yunet(model) if model else None
+
+    # Fallback: Haar cascades when no DNN model is given or it fails to load
     face_cascades = []
-    for name in ["haarcascade_frontalface_alt2.xml",
-                 "haarcascade_frontalface_default.xml",
-                 "haarcascade_profileface.xml"]:
-        c = cv2.CascadeClassifier(cv2.data.haarcascades + name)
+    body_cascade = None
+    if detector is None:
+        # Primary: face detection (multiple cascades for robustness)
+        for name in ["haarcascade_frontalface_alt2.xml",
+                     "haarcascade_frontalface_default.xml",
+                     "haarcascade_profileface.xml"]:
+            c = cv2.CascadeClassifier(cv2.data.haarcascades + name)
+            if not c.empty():
+                face_cascades.append((name, c))
+
+        # Fallback: upper body detection (works when face is obscured)
+        c = cv2.CascadeClassifier(cv2.data.haarcascades + "haarcascade_upperbody.xml")
         if not c.empty():
-            face_cascades.append((name, c))
+            body_cascade = c
 
-    # Fallback: upper body detection (works when face is obscured)
-    body_cascade = cv2.CascadeClassifier(
-        cv2.data.haarcascades + "haarcascade_upperbody.xml"
-    )
+        if not face_cascades and body_cascade is None:
+            print("ERROR: Could not load any cascade classifiers", file=sys.stderr)
+            sys.exit(1)
 
-    if not face_cascades and body_cascade.empty():
-        print("ERROR: Could not load any cascade classifiers", file=sys.stderr)
-        sys.exit(1)
+    # The first cascade (alt2, the most accurate frontal one) runs every frame;
+    # the rest are backups (see FALLBACK_EVERY in the loop).
+    primary_cascades, backup_cascades = face_cascades[:1], face_cascades[1:]
 
     cap = cv2.VideoCapture(device)
     if not cap.isOpened():
@@ -157,8 +316,9 @@ def run_tracker(device: int = 0, interval: float = 0.15,
     cmd_path = get_command_path()
     status_path = get_status_path()
     print(f"Face tracker started (device={device}, interval={interval}s)")
+    print(f"DNN detector: {model if detector is not None else 'no'}")
     print(f"Cascades loaded: {[n for n,_ in face_cascades]}")
-    print(f"Body fallback: {'yes' if not body_cascade.empty() else 'no'}")
+    print(f"Body fallback: {'yes' if body_cascade is not None else 'no'}")
     print(f"Command path: {cmd_path}")
 
     running = True
@@ -171,46 +331,101 @@ def run_tracker(device: int = 0, interval: float = 0.15,
     signal.signal(signal.SIGINT, handle_signal)
 
     last_gaze_x, last_gaze_y = 0.0, 0.0
+    written_x, written_y = 0.0, 0.0  # gaze last written to command.json
+    WRITE_EPSILON = 0.01  # gaze change (L1) below which we skip the write
     smoothing = 0.4  # lower = smoother, higher = more responsive
     no_face_count = 0
     NO_FACE_THRESHOLD = 8  # frames without face before clearing look
+    IDLE_AFTER = 30  # consecutive misses before polling at idle_interval
+    idle_interval = max(interval, IDLE_INTERVAL)
     tracking_active = False  # whether we're currently tracking someone
-    last_seen_time = 0.0     # timestamp of last face detection
+    last_seen_time = None    # monotonic time we last lost a face (None = never)
     GREETING_COOLDOWN = 300  # seconds (5 min) before showing greeting again
+    last_box = None          # last face box in downscaled coords (ROI search)
+    frames_since_full = 0    # ROI-only frames since the last full-frame search
+    FULL_SEARCH_EVERY = 30   # force a full-frame search this often while tracking
+    ROI_PAD = 0.4            # grow the last box by this fraction on each side
+    FALLBACK_EVERY = 5       # run backup/body cascades on every Nth missed frame
+
+    # Detection size bounds as fractions of the downscaled frame's short side
+    # (cameras may ignore the requested 320x240). Capping the size trims the
+    # cascade's scale pyramid; a face filling the whole frame is too close to
+    # give a useful gaze direction anyway.
+    FACE_MIN_FRAC, FACE_MAX_FRAC = 1 / 12, 5 / 6
+    BODY_MIN_FRAC, BODY_MAX_FRAC = 1 / 8, 1.0
+    SINGLE_THREAD_PX = 20_000  # downscaled frames smaller than this run single-threaded
+    inv_scale = 1.0 / scale
+    frame_shape = None  # (h, w) of the last frame; sizes below derive from it
+
+    grabber = FrameGrabber(cap)
 
     try:
         while running:
-            ret, frame = cap.read()
+            ret, frame = grabber.read()
             if not ret:
                 time.sleep(interval)
                 continue
 
-            # Downscale for faster detection
-            h, w = frame.shape[:2]
-            small = cv2.resize(frame, (int(w * scale), int(h * scale)))
-            gray = cv2.cvtColor(small, cv2.COLOR_BGR2GRAY)
-
-            # Try face detection with each cascade
-            faces = []
-            for _name, cascade in face_cascades:
-                faces = cascade.detectMultiScale(
-                    gray,
-                    scaleFactor=1.1,
-                    minNeighbors=3,
-                    minSize=(int(20 * scale), int(20 * scale)),
-                    flags=cv2.CASCADE_SCALE_IMAGE,
-                )
-                if len(faces) > 0:
-                    break
+            # Frame geometry only changes if the camera switches modes, so
+            # derive the downscaled size (and detector input size) once.
+            if frame.shape[:2] != frame_shape:
+                frame_shape = frame.shape[:2]
+                h, w = frame_shape
+                small_w, small_h = int(w * scale), int(h * scale)
+                side = min(small_w, small_h)
+                face_min = (int(side * FACE_MIN_FRAC),) * 2
+                face_max = (int(side * FACE_MAX_FRAC),) * 2
+                body_min = (int(side * BODY_MIN_FRAC),) * 2
+                body_max = (int(side * BODY_MAX_FRAC),) * 2
+                # On tiny images parallel_for dispatch costs more than it
+                # saves; only let OpenCV spread larger frames across cores.
+                cv2.setNumThreads(1 if small_w * small_h < SINGLE_THREAD_PX else -1)
+                if detector is not None:
+                    detector.setInputSize((small_w, small_h))
+                last_box = None  # old ROI is in the previous geometry
+
+            # Downscale for faster detection (area averaging suits shrinking)
+            small = cv2.resize(frame, (small_w, small_h), interpolation=cv2.INTER_AREA)
+
+            # Right after losing a face, then every FALLBACK_EVERY misses
+            fallback_due = no_face_count % FALLBACK_EVERY == 0
+
+            if detector is not None:
+                _, dets = detector.detect(small)
+                faces = dets[:, :4].astype(int) if dets is not None else []
+            else:
+                gray = cv2.cvtColor(small, cv2.COLOR_BGR2GRAY)
+
+                # While tracking, search only around the last face; the sliding
+                # window count scales with pixels, so this is far cheaper.
+                faces = []
+                if last_box is not None and frames_since_full < FULL_SEARCH_EVERY:
+                    x0, y0, x1, y1 = roi_around(last_box, ROI_PAD, small_w, small_h)
+                    faces = detect_cascades(primary_cascades, gray[y0:y1, x0:x1],
+                                            face_min, face_max)
+                    if len(faces) > 0:
+                        faces = faces + (x0, y0, 0, 0)
+                        frames_since_full += 1
+
+                # Full-frame search: first frame, lost track, or periodic refresh
+                if len(faces) == 0:
+                    faces = detect_cascades(primary_cascades, gray, face_min, face_max)
+                    frames_since_full = 0
+
+                # Backup cascades each walk the whole image again, so while
+                # nobody is around only try them every few frames.
+                if len(faces) == 0 and backup_cascades and fallback_due:
+                    faces = detect_cascades(backup_cascades, gray, face_min, face_max)
 
             # Fallback to upper body if no face found
             is_body = False
-            if len(faces) == 0 and not body_cascade.empty():
+            if len(faces) == 0 and body_cascade is not None and fallback_due:
                 faces = body_cascade.detectMultiScale(
                     gray,
                     scaleFactor=1.05,
                     minNeighbors=2,
-                    minSize=(int(30 * scale), int(30 * scale)),
+                    minSize=body_min,
+                    maxSize=body_max,
                     flags=cv2.CASCADE_SCALE_IMAGE,
                 )
                 is_body = len(faces) > 0
@@ -221,17 +436,18 @@ def run_tracker(device: int = 0, interval: float = 0.15,
                 no_face_count = 0
 
                 # Use the largest detection (closest person)
-                areas = [fw * fh for (_, _, fw, fh) in faces]
-                best = max(range(len(faces)), key=lambda i: areas[i])
+                # (detectors return an (N, 4) ndarray here, so reduce in C)
+                best = int((faces[:, 2] * faces[:, 3]).argmax())
                 fx, fy, fw, fh = faces[best]
+                last_box = None if is_body else (int(fx), int(fy), int(fw), int(fh))
 
                 # Scale back to original frame coordinates
-                cx = (fx + fw / 2) / scale
+                cx = (fx + fw / 2) * inv_scale
                 # For body detection, estimate face position (upper third)
                 if is_body:
-                    cy = (fy + fh * 0.25) / scale
+                    cy = (fy + fh * 0.25) * inv_scale
                 else:
-                    cy = (fy + fh / 2) / scale
+                    cy = (fy + fh / 2) * inv_scale
 
                 target_x, target_y = map_face_to_gaze(cx, cy, w, h)
 
@@ -239,13 +455,19 @@ def run_tracker(device: int = 0, interval: float = 0.15,
                 last_gaze_x += (target_x - last_gaze_x) * smoothing
                 last_gaze_y += (target_y - last_gaze_y) * smoothing
 
-                write_look(cmd_path, last_gaze_x, last_gaze_y, current_cmd)
+                # Skip the atomic rewrite for sub-visible movement, unless the
+                # look override vanished (e.g. another writer replaced the file)
+                if ("look" not in current_cmd
+                        or abs(last_gaze_x - written_x) + abs(last_gaze_y - written_y)
+                        > WRITE_EPSILON):
+                    write_look(cmd_path, last_gaze_x, last_gaze_y, current_cmd)
+                    written_x, written_y = last_gaze_x, last_gaze_y
 
                 # Show greeting when we first detect someone (with cooldown)
                 if not tracking_active:
                     tracking_active = True
-                    now = time.time()
-                    if now - last_seen_time > GREETING_COOLDOWN:
+                    now = time.monotonic()
+                    if last_seen_time is None or now - last_seen_time > GREETING_COOLDOWN:
                         greeting = random.choice(GREETINGS)
                         write_status(status_path, greeting)
                         print(f"Face detected — {greeting}")
@@ -253,6 +475,7 @@ def run_tracker(device: int = 0, interval: float = 0.15,
                         print("Face detected (cooldown active, no greeting)")
 
             else:
+                last_box = None
                 no_face_count += 1
                 if no_face_count >= NO_FACE_THRESHOLD:
                     # No face for a while — clear the look override
@@ -263,15 +486,21 @@ def run_tracker(device: int = 0, interval: float = 0.15,
                     # Clear our greeting if it's still showing
                     if tracking_active:
                         tracking_active = False
-                        last_seen_time = time.time()
+                        last_seen_time = time.monotonic()
                         cur_status = read_status(status_path)
                         if cur_status in GREETINGS:
                             write_status(status_path, "")
                             print("Face lost — cleared greeting")
 
-            time.sleep(interval)
+            # Back off while nobody has been around for a while; the first
+            # hit drops straight back to the normal rate. The grabber pauses
+            # with us so the camera thread doesn't keep waking at full rate.
+            idle = no_face_count >= IDLE_AFTER
+            grabber.set_idle(idle)
+            time.sleep(idle_interval if idle else interval)
 
     finally:
+        grabber.stop()
         cap.release()
         # Clean up look override and status on exit
         try:
@@ -294,8 +523,11 @@ def main() -> None:
                         help="Seconds between captures (default: 0.15)")
     parser.add_argument("--scale", type=float, default=0.3,
                         help="Frame downscale factor for detection (default: 0.3)")
+    parser.add_argument("--model", default=None,
+                        help="YuNet ONNX face model; Haar cascades are used if omitted")
     args = parser.parse_args()
-    run_tracker(device=args.device, interval=args.interval, scale=args.scale)
+    run_tracker(device=args.device, interval=args.interval, scale=args.scale,
+                model=args.model)
 
 
 if __name__ == "__main__":
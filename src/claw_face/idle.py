@@ -11,13 +11,14 @@ Runs as a user daemon:
 from __future__ import annotations
 
 import argparse
+import math
 import os
 import signal
 import subprocess
 import sys
-import threading
-from dataclasses import dataclass
-from datetime import datetime, time, timedelta
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
 from typing import Any, Optional
 
 Gio: Any = None
@@ -52,13 +53,32 @@ class Settings:
     face_args: list[str]
     screen_off: Optional[tuple[int, int]] = None  # (hour, minute) — start of night
     screen_on: Optional[tuple[int, int]] = None  # (hour, minute) — end of night
+    # Minutes since midnight of screen_off / screen_on, derived once.
+    off_minute: Optional[int] = field(init=False, default=None)
+    on_minute: Optional[int] = field(init=False, default=None)
+    # Full command line for the face process, assembled once.
+    face_argv: tuple[str, ...] = field(init=False, default=())
+
+    def __post_init__(self) -> None:
+        argv = (sys.executable, "-m", "claw_face.main", "--port", str(self.face_port))
+        object.__setattr__(self, "face_argv", argv + tuple(self.face_args))
+        if self.screen_off is not None:
+            object.__setattr__(self, "off_minute", self.screen_off[0] * 60 + self.screen_off[1])
+        if self.screen_on is not None:
+            object.__setattr__(self, "on_minute", self.screen_on[0] * 60 + self.screen_on[1])
 
 
 def _get_idle_seconds_from_gsettings() -> int:
     # org.gnome.desktop.session idle-delay is uint32 seconds.
     _load_gi()
     try:
-        s = Gio.Settings.new("org.gnome.desktop.session")
+        # Gio.Settings.new() aborts the process on a missing schema (non-GNOME
+        # sessions), so look it up first.
+        source = Gio.SettingsSchemaSource.get_default()
+        schema = source.lookup("org.gnome.desktop.session", True) if source else None
+        if schema is None:
+            return 300
+        s = Gio.Settings.new_full(schema, None, None)
         v = int(s.get_uint("idle-delay"))
         # GNOME uses 0 to mean "never". For our daemon, treat it as a reasonable default
         # rather than launching immediately.
@@ -70,11 +90,17 @@ def _get_idle_seconds_from_gsettings() -> int:
         return 300
 
 
-def _proxy(bus_name: str, object_path: str, interface: str) -> Gio.DBusProxy:
+def _proxy(
+    bus_name: str, object_path: str, interface: str, *, signals: bool = False
+) -> Gio.DBusProxy:
+    """Session-bus proxy that skips the property fetch (we only call methods)."""
     _load_gi()
+    flags = Gio.DBusProxyFlags.DO_NOT_LOAD_PROPERTIES
+    if not signals:
+        flags |= Gio.DBusProxyFlags.DO_NOT_CONNECT_SIGNALS
     return Gio.DBusProxy.new_for_bus_sync(
         Gio.BusType.SESSION,
-        Gio.DBusProxyFlags.NONE,
+        flags,
         None,
         bus_name,
         object_path,
@@ -88,6 +114,26 @@ def _dbus_call(proxy: Gio.DBusProxy, method: str, params: Optional[GLib.Variant]
     return proxy.call_sync(method, params, Gio.DBusCallFlags.NONE, -1, None)
 
 
+def _ignore_reply(proxy: Gio.DBusProxy, result: Gio.AsyncResult, _data: Any) -> None:
+    try:
+        proxy.call_finish(result)
+    except Exception:
+        pass
+
+
+def _dbus_call_async(proxy: Gio.DBusProxy, method: str, params: Optional[GLib.Variant] = None):
+    """Fire-and-forget call for methods whose reply we don't need.
+
+    Messages on one connection are delivered in order, so a later sync call
+    (e.g. AddIdleWatch) still lands after this one.
+    """
+    _load_gi()
+    try:
+        proxy.call(method, params, Gio.DBusCallFlags.NONE, -1, None, _ignore_reply, None)
+    except Exception:
+        pass
+
+
 def _screensaver_get_active(screensaver: Gio.DBusProxy) -> bool:
     try:
         out = _dbus_call(screensaver, "GetActive", None)
@@ -96,7 +142,43 @@ def _screensaver_get_active(screensaver: Gio.DBusProxy) -> bool:
         return False
 
 
+def _mark_reaped(proc: subprocess.Popen, status: int) -> None:
+    """Record a GLib-reaped child's exit so Popen never waits on the pid itself."""
+    try:
+        proc.returncode = os.waitstatus_to_exitcode(status)
+    except ValueError:
+        proc.returncode = status
+
+
+# Run by _prewarm_face(): pull the face's Python and pywebview code off disk.
+_PREWARM_CODE = """
+import claw_face.main, claw_face.server
+try:
+    import webview
+except Exception:
+    pass
+"""
+
+
 class IdleDaemon:
+    __slots__ = (
+        "settings",
+        "idle",
+        "_screensaver",
+        "_display_config_proxy",
+        "_loop",
+        "_idle_watch_id",
+        "_user_active_watch_id",
+        "_face_proc",
+        "_transition_timer_id",
+        "_prewarm_timer_id",
+        "_exiting",
+        "_rearm_pending",
+        "_night_cache",
+        "_dpms_mode",
+        "_child_env",
+    )
+
     def __init__(self, settings: Settings):
         _load_gi()
         self.settings = settings
@@ -104,28 +186,46 @@ class IdleDaemon:
             "org.gnome.Mutter.IdleMonitor",
             "/org/gnome/Mutter/IdleMonitor/Core",
             "org.gnome.Mutter.IdleMonitor",
+            signals=True,
         )
-        self.screensaver = _proxy(
-            "org.gnome.ScreenSaver",
-            "/org/gnome/ScreenSaver",
-            "org.gnome.ScreenSaver",
-        )
-
-        if settings.screen_off is not None:
-            self._display_config = _proxy(
-                "org.gnome.Mutter.DisplayConfig",
-                "/org/gnome/Mutter/DisplayConfig",
-                "org.freedesktop.DBus.Properties",
-            )
-        else:
-            self._display_config = None
+        # Created on first use; often never needed (no lock, no night schedule).
+        self._screensaver: Optional[Gio.DBusProxy] = None
+        self._display_config_proxy: Optional[Gio.DBusProxy] = None
 
         self._loop = GLib.MainLoop()
         self._idle_watch_id: Optional[int] = None
         self._user_active_watch_id: Optional[int] = None
         self._face_proc: Optional[subprocess.Popen] = None
         self._transition_timer_id: Optional[int] = None
+        self._prewarm_timer_id: Optional[int] = None
         self._exiting = False
+        self._rearm_pending = False
+        self._night_cache: tuple[int, bool] = (-1, False)  # (epoch minute, is night)
+        self._dpms_mode: Optional[int] = None  # last PowerSaveMode we set (None = unknown)
+        # Environment for the face process; only PYTHONUNBUFFERED ever differs.
+        self._child_env = {"PYTHONUNBUFFERED": "1", **os.environ}
+
+    @property
+    def screensaver(self) -> Gio.DBusProxy:
+        if self._screensaver is None:
+            self._screensaver = _proxy(
+                "org.gnome.ScreenSaver",
+                "/org/gnome/ScreenSaver",
+                "org.gnome.ScreenSaver",
+            )
+        return self._screensaver
+
+    @property
+    def _display_config(self) -> Optional[Gio.DBusProxy]:
+        if self.settings.screen_off is None:
+            return None
+        if self._display_config_proxy is None:
+            self._display_config_proxy = _proxy(
+                "org.gnome.Mutter.DisplayConfig",
+                "/org/gnome/Mutter/DisplayConfig",
+                "org.freedesktop.DBus.Properties",
+            )
+        return self._display_config_proxy
 
     # -- Night schedule helpers ------------------------------------------
 
@@ -133,67 +233,56 @@ class IdleDaemon:
         return self.settings.screen_off is not None and self.settings.screen_on is not None
 
     def _is_night(self) -> bool:
-        if not self._night_enabled():
+        t_off = self.settings.off_minute
+        t_on = self.settings.on_minute
+        if t_off is None or t_on is None:
             return False
-        now = datetime.now().time()
-        off_h, off_m = self.settings.screen_off  # type: ignore[misc]
-        on_h, on_m = self.settings.screen_on  # type: ignore[misc]
-        t_off = time(off_h, off_m)
-        t_on = time(on_h, on_m)
+        # The answer only changes when the wall-clock minute does, and local
+        # minutes roll over together with epoch minutes, so key on that.
+        epoch_minute = int(time.time() // 60)
+        if self._night_cache[0] == epoch_minute:
+            return self._night_cache[1]
+        now = datetime.now()
+        now_minute = now.hour * 60 + now.minute
         if t_off <= t_on:
             # e.g. 01:00–06:00 (no midnight wrap)
-            return t_off <= now < t_on
+            night = t_off <= now_minute < t_on
         else:
             # e.g. 22:00–07:00 (wraps midnight)
-            return now >= t_off or now < t_on
+            night = now_minute >= t_off or now_minute < t_on
+        self._night_cache = (epoch_minute, night)
+        return night
 
-    def _dpms_off(self) -> None:
-        if self._display_config is None:
+    def _set_power_save(self, mode: int) -> None:
+        # Skip repeats of the mode we last set (forgotten on every watch event).
+        if self._display_config is None or self._dpms_mode == mode:
             return
-        try:
-            _dbus_call(
-                self._display_config,
-                "Set",
-                GLib.Variant(
-                    "(ssv)",
-                    ("org.gnome.Mutter.DisplayConfig", "PowerSaveMode", GLib.Variant("i", 3)),
-                ),
-            )
-        except Exception:
-            pass
+        _dbus_call_async(
+            self._display_config,
+            "Set",
+            GLib.Variant(
+                "(ssv)",
+                ("org.gnome.Mutter.DisplayConfig", "PowerSaveMode", GLib.Variant("i", mode)),
+            ),
+        )
+        self._dpms_mode = mode
+
+    def _dpms_off(self) -> None:
+        self._set_power_save(3)
 
     def _dpms_on(self) -> None:
-        if self._display_config is None:
-            return
-        try:
-            _dbus_call(
-                self._display_config,
-                "Set",
-                GLib.Variant(
-                    "(ssv)",
-                    ("org.gnome.Mutter.DisplayConfig", "PowerSaveMode", GLib.Variant("i", 0)),
-                ),
-            )
-        except Exception:
-            pass
+        self._set_power_save(0)
 
     def _seconds_until_next_transition(self) -> int:
         """Seconds from now until the next screen-off or screen-on boundary."""
         now = datetime.now()
-        off_h, off_m = self.settings.screen_off  # type: ignore[misc]
-        on_h, on_m = self.settings.screen_on  # type: ignore[misc]
-
-        # Build candidate datetimes for today and tomorrow
-        candidates: list[datetime] = []
-        for day_offset in (0, 1):
-            base = now + timedelta(days=day_offset)
-            for h, m in ((off_h, off_m), (on_h, on_m)):
-                dt = base.replace(hour=h, minute=m, second=0, microsecond=0)
-                if dt > now:
-                    candidates.append(dt)
-
-        nearest = min(candidates)
-        return max(1, int((nearest - now).total_seconds()))
+        now_s = now.hour * 3600 + now.minute * 60 + now.second + now.microsecond / 1e6
+        # Distance forward to each boundary; a boundary at exactly "now" is a day away.
+        to_off = (self.settings.off_minute * 60 - now_s) % 86400 or 86400  # type: ignore[operator]
+        to_on = (self.settings.on_minute * 60 - now_s) % 86400 or 86400  # type: ignore[operator]
+        # Round up: firing even a fraction early would see the old period in
+        # _is_night() and need a second wakeup right after.
+        return max(1, math.ceil(min(to_off, to_on)))
 
     def _schedule_transition(self) -> None:
         if self._transition_timer_id is not None:
@@ -202,6 +291,7 @@ class IdleDaemon:
         if not self._night_enabled():
             return
         secs = self._seconds_until_next_transition()
+        # Second-granularity timers let GLib batch this wakeup with others.
         self._transition_timer_id = GLib.timeout_add_seconds(secs, self._on_transition)
 
     def _on_transition(self) -> int:
@@ -218,25 +308,25 @@ class IdleDaemon:
             self._dpms_on()
 
         # Re-arm idle watch so the correct action fires on next idle
-        self._remove_watch(self._idle_watch_id)
-        self._idle_watch_id = None
         self._remove_watch(self._user_active_watch_id)
         self._user_active_watch_id = None
-        try:
-            _dbus_call(self.idle, "ResetIdletime", None)
-        except Exception:
-            pass
-        self._set_idle_watch()
+        self._request_rearm()
 
         # Schedule the next boundary
         self._schedule_transition()
         return GLib.SOURCE_REMOVE
 
     def _kill_face(self) -> None:
-        if self._face_proc is not None and self._face_proc.poll() is None:
+        # GLib owns reaping (see _on_face_exited), so signal the pid directly:
+        # Popen.terminate() would poll() and could reap the child under GLib.
+        # GLib builds without pidfd child watches reap from their worker thread
+        # before _on_face_exited runs here, so in that short window the pid may
+        # already be recycled; the face exiting on its own is rare enough to
+        # accept that.
+        if self._face_proc is not None:
             try:
-                self._face_proc.terminate()
-            except Exception:
+                os.kill(self._face_proc.pid, signal.SIGTERM)
+            except OSError:
                 pass
 
     # -- Watch management ------------------------------------------------
@@ -244,10 +334,7 @@ class IdleDaemon:
     def _remove_watch(self, watch_id: Optional[int]) -> None:
         if watch_id is None:
             return
-        try:
-            _dbus_call(self.idle, "RemoveWatch", GLib.Variant("(u)", (int(watch_id),)))
-        except Exception:
-            pass
+        _dbus_call_async(self.idle, "RemoveWatch", GLib.Variant("(u)", (int(watch_id),)))
 
     def _set_idle_watch(self) -> None:
         # Remove any previous watch (safety), then re-add.
@@ -276,6 +363,10 @@ class IdleDaemon:
         if self._exiting:
             return
 
+        # Activity since our last Set may have woken the display behind our
+        # back, so the next DPMS request must go out even if it repeats.
+        self._dpms_mode = None
+
         if self._idle_watch_id is not None and fired_id == self._idle_watch_id:
             # One-shot: remove this watch while we run.
             self._remove_watch(self._idle_watch_id)
@@ -287,11 +378,7 @@ class IdleDaemon:
             self._remove_watch(self._user_active_watch_id)
             self._user_active_watch_id = None
             # After user activity (e.g., unlock), restart the idle countdown from "now".
-            try:
-                _dbus_call(self.idle, "ResetIdletime", None)
-            except Exception:
-                pass
-            GLib.idle_add(self._set_idle_watch)
+            self._request_rearm()
             return
 
     def _start_face_if_needed(self):
@@ -301,43 +388,73 @@ class IdleDaemon:
             self._dpms_off()
             self._set_user_active_watch()
             return GLib.SOURCE_REMOVE
-        if self._face_proc is not None and self._face_proc.poll() is None:
+        if self._face_proc is not None:  # cleared by _on_face_exited
             return GLib.SOURCE_REMOVE
         if _screensaver_get_active(self.screensaver):
             # Don't re-arm the idle watch while locked; wait until we see activity again.
             self._set_user_active_watch()
             return GLib.SOURCE_REMOVE
 
-        cmd = [sys.executable, "-m", "claw_face.main"]
-        cmd += ["--port", str(self.settings.face_port)]
-        cmd += list(self.settings.face_args)
-
-        env = os.environ.copy()
-        env.setdefault("PYTHONUNBUFFERED", "1")
-        self._face_proc = subprocess.Popen(cmd, env=env)
+        self._face_proc = subprocess.Popen(self.settings.face_argv, env=self._child_env)
 
-        t = threading.Thread(target=self._wait_face_then_rearm, daemon=True)
-        t.start()
+        # GLib reaps the child and calls back on the main loop; no waiter thread.
+        GLib.child_watch_add(GLib.PRIORITY_DEFAULT, self._face_proc.pid, self._on_face_exited)
         return GLib.SOURCE_REMOVE
 
-    def _wait_face_then_rearm(self) -> None:
-        proc = self._face_proc
-        if proc is None:
-            return
+    def _prewarm_face(self) -> int:
+        """Import the face's modules once in a throwaway process.
+
+        The first real launch then finds them in the page cache instead of
+        showing a blank screen while a cold disk loads them.
+        """
+        self._prewarm_timer_id = None
+        if self._exiting or self._face_proc is not None:
+            return GLib.SOURCE_REMOVE
         try:
-            proc.wait()
-        finally:
-            self._face_proc = None
+            proc = subprocess.Popen(
+                (sys.executable, "-c", _PREWARM_CODE),
+                env=self._child_env,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            )
+        except OSError:
+            return GLib.SOURCE_REMOVE
+        # The closure keeps proc alive until GLib has reaped it; otherwise its
+        # __del__ would queue it for subprocess's own waitpid() cleanup.
+        GLib.child_watch_add(
+            GLib.PRIORITY_LOW, proc.pid, lambda _pid, status: _mark_reaped(proc, status)
+        )
+        return GLib.SOURCE_REMOVE
+
+    def _on_face_exited(self, _pid: int, status: int) -> None:
+        if self._face_proc is not None:
+            _mark_reaped(self._face_proc, status)
+        self._face_proc = None
 
         if self._exiting:
             return
 
         # Restart the idle timer from "now".
-        try:
-            _dbus_call(self.idle, "ResetIdletime", None)
-        except Exception:
-            pass
-        GLib.idle_add(self._set_idle_watch)
+        self._request_rearm()
+
+    def _request_rearm(self) -> None:
+        """Reset idle time and re-add the idle watch, once per main-loop pass.
+
+        Transitions, user activity and face exit can all ask for a re-arm in
+        quick succession; they share a single low-priority idle callback.
+        """
+        if self._rearm_pending:
+            return
+        self._rearm_pending = True
+        GLib.idle_add(self._do_rearm, priority=GLib.PRIORITY_LOW)
+
+    def _do_rearm(self) -> int:
+        self._rearm_pending = False
+        if self._exiting:
+            return GLib.SOURCE_REMOVE
+        _dbus_call_async(self.idle, "ResetIdletime")
+        self._set_idle_watch()
+        return GLib.SOURCE_REMOVE
 
     def stop(self) -> None:
         self._exiting = True
@@ -345,10 +462,18 @@ class IdleDaemon:
         self._idle_watch_id = None
         self._remove_watch(self._user_active_watch_id)
         self._user_active_watch_id = None
+        # RemoveWatch is fire-and-forget; make sure it leaves before we exit.
+        try:
+            self.idle.get_connection().flush_sync(None)
+        except Exception:
+            pass
 
         if self._transition_timer_id is not None:
             GLib.source_remove(self._transition_timer_id)
             self._transition_timer_id = None
+        if self._prewarm_timer_id is not None:
+            GLib.source_remove(self._prewarm_timer_id)
+            self._prewarm_timer_id = None
 
         self._kill_face()
 
@@ -357,20 +482,28 @@ class IdleDaemon:
         except Exception:
             pass
 
+    def _handle_signal(self) -> int:
+        self.stop()
+        return GLib.SOURCE_REMOVE
+
     def run(self) -> int:
         self._set_idle_watch()
         self.idle.connect("g-signal", self._on_idle_signal)
         if self._night_enabled():
             self._schedule_transition()
+        self._prewarm_timer_id = GLib.timeout_add_seconds(
+            max(1, self.settings.idle_seconds // 2),
+            self._prewarm_face,
+            priority=GLib.PRIORITY_LOW,
+        )
 
-        def _handle_sig(_signum, _frame):
-            self.stop()
-
+        # Delivered as a main-loop source, so stop() never runs from inside a
+        # Python signal handler interleaved with other GLib callbacks. While
+        # Python's default SIGINT handler is installed, MainLoop.run() swaps in
+        # its own that just quits and raises KeyboardInterrupt, so drop it first.
+        signal.signal(signal.SIGINT, signal.SIG_DFL)
         for s in (signal.SIGINT, signal.SIGTERM):
-            try:
-                signal.signal(s, _handle_sig)
-            except Exception:
-                pass
+            GLib.unix_signal_add(GLib.PRIORITY_HIGH, s, self._handle_signal)
 
         self._loop.run()
         return 0
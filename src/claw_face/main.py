@@ -8,16 +8,92 @@ Or after install:
   claw-face
 """
 
-import argparse
-import logging
 import sys
 
 from . import __version__
-from .config import CONFIG_FILE, Config
 
 
-def parse_args():
+def _fast_path(argv):
+    """Answer ``--version`` before argparse or the config module are imported."""
+    if argv in (["--version"], ["-v"]):
+        print(f"Claw Face {__version__}")
+        return True
+    return False
+
+
+# Flags _parse_simple understands: option -> (dest, value type, or None for a switch).
+_SIMPLE_OPTIONS = {
+    "--log-level": ("log_level", str),
+    "--host": ("host", str),
+    "--port": ("port", int),
+    "--browser": ("browser", None),
+    "--headless": ("headless", None),
+    "--windowed": ("windowed", None),
+    "--width": ("width", int),
+    "--height": ("height", int),
+    "--fps": ("fps", int),
+    "--config": ("config", str),
+    "-c": ("config", str),
+    "--save-config": ("save_config", None),
+}
+_SIMPLE_DEFAULTS = {
+    "log_level": "INFO",
+    "host": None,
+    "port": None,
+    "browser": False,
+    "headless": False,
+    "windowed": False,
+    "width": None,
+    "height": None,
+    "fps": None,
+    "config": None,
+    "save_config": False,
+}
+
+
+def _parse_simple(argv):
+    """Parse the common, well-formed invocations without importing argparse.
+
+    Returns None for anything unusual (help, abbreviations, bad values, conflicting
+    modes...) so that parse_args() produces the exact same result or error message.
+    """
+    from types import SimpleNamespace
+
+    values = dict(_SIMPLE_DEFAULTS)
+    it = iter(argv)
+    for token in it:
+        if token.startswith("--"):
+            option, eq, inline = token.partition("=")
+        else:
+            option, eq, inline = token, "", ""
+        spec = _SIMPLE_OPTIONS.get(option)
+        if spec is None:
+            return None
+        dest, kind = spec
+        if kind is None:
+            if eq:
+                return None
+            values[dest] = True
+            continue
+        if eq:
+            value = inline
+        else:
+            value = next(it, None)
+            if value is None or value.startswith("-"):
+                return None
+        try:
+            values[dest] = kind(value)
+        except ValueError:
+            return None
+    if values["browser"] and values["headless"]:
+        return None
+    return SimpleNamespace(**values)
+
+
+def parse_args(argv=None):
     """Parse command line arguments."""
+    import argparse
+
     parser = argparse.ArgumentParser(
         description="Claw Face - An animated face display",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -77,7 +153,10 @@ Examples:
     )
 
     parser.add_argument(
-        "--config", "-c", type=str, help=f"Path to config file (default: {CONFIG_FILE})"
+        "--config",
+        "-c",
+        type=str,
+        help="Path to config file (default: ~/.config/claw-face/config.json)",
     )
 
     parser.add_argument(
@@ -86,12 +165,21 @@ Examples:
         help="Save default configuration to config file and exit",
     )
 
-    return parser.parse_args()
+    return parser.parse_args(argv)
 
 
 def main():
     """Main entry point."""
-    args = parse_args()
+    if _fast_path(sys.argv[1:]):
+        return 0
+
+    args = _parse_simple(sys.argv[1:])
+    if args is None:
+        args = parse_args()
+
+    import logging
+
+    from .config import CONFIG_FILE, Config
 
     logging.basicConfig(
         level=getattr(logging, str(args.log_level).upper(), logging.INFO),
@@ -102,7 +190,7 @@ def main():
     # Handle --save-config
     if args.save_config:
         config = Config()
-        config.save()
+        config.save(validate=False)  # defaults are already valid
         print(f"Default configuration saved to: {CONFIG_FILE}")
         print("Edit this file to customize colors, behavior, and display settings.")
         return 0
@@ -1,25 +1,29 @@
 import ipaddress
-import json
 import logging
 import os
 import queue
 import threading
-import webbrowser
-from functools import partial
 from http import HTTPStatus
 from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
 
+from . import _json
 from .config import CONFIG_DIR, Config
 
 STATUS_FILE = CONFIG_DIR / "status.txt"
 COMMAND_FILE = CONFIG_DIR / "command.json"
 WEB_DIR = Path(__file__).parent / "web"
+_WEB_DIR_STR = str(WEB_DIR)
 
 log = logging.getLogger(__name__)
 
 
+_LOOPBACK = frozenset({"127.0.0.1", "::1"})
+
+
 def _is_loopback_address(addr: str) -> bool:
+    if addr in _LOOPBACK:
+        return True
     try:
         return ipaddress.ip_address(addr).is_loopback
     except ValueError:
@@ -31,61 +35,115 @@ def _is_loopback_address(addr: str) -> bool:
 # ────────────────────────────────────────────────────────────
 
 
+def _read_small(path: Path) -> bytes:
+    """Read a small file with raw os calls, skipping buffered io setup."""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        chunks = []
+        while chunk := os.read(fd, 65536):
+            chunks.append(chunk)
+    finally:
+        os.close(fd)
+    return b"".join(chunks)
+
+
 def _read_status_data() -> dict:
     """Read status.txt and return {"text": ...}."""
-    text = ""
     try:
-        if STATUS_FILE.exists():
-            text = STATUS_FILE.read_text().strip()
-    except OSError:
-        pass
+        text = _read_small(STATUS_FILE).decode("utf-8", "replace").strip()
+    except OSError:  # includes FileNotFoundError
+        text = ""
     return {"text": text}
 
 
+def _is_number(v) -> bool:
+    return isinstance(v, (int, float)) and v == v  # v == v rejects NaN
+
+
+def _as_str(v):
+    return v if isinstance(v, str) else None
+
+
+def _as_bool(v):
+    return v if isinstance(v, bool) else None
+
+
+def _as_unit(v):
+    return max(0.0, min(1.0, float(v))) if _is_number(v) else None
+
+
+def _as_seq(v):
+    return int(v) if _is_number(v) else None
+
+
+def _as_look(v):
+    if isinstance(v, dict):
+        x = v.get("x")
+        y = v.get("y")
+        if _is_number(x) and _is_number(y):
+            return {"x": max(-1.0, min(1.0, float(x))), "y": max(-1.0, min(1.0, float(y)))}
+    return None
+
+
+# command.json field -> sanitizer returning the cleaned value, or None to drop it.
+_COMMAND_FIELDS = (
+    ("expression", _as_str),
+    ("auto_cycle", _as_bool),
+    ("intensity", _as_unit),
+    ("look", _as_look),
+    ("blink_seq", _as_seq),
+    ("sequence", _as_str),
+    ("sequence_seq", _as_seq),
+)
+
+
 def _read_command_data() -> dict:
     """Read command.json and return validated/clamped fields."""
     data = {}
     try:
-        if COMMAND_FILE.exists():
-            raw = COMMAND_FILE.read_text().strip()
-            if raw:
-                data = json.loads(raw)
-    except (OSError, json.JSONDecodeError):
+        raw = _read_small(COMMAND_FILE).strip()
+        if raw:
+            data = _json.loads(raw)
+    except (OSError, ValueError):  # missing file, bad JSON or bad UTF-8
         data = {}
     out: dict[str, object] = {}
     if isinstance(data, dict):
-        if isinstance(data.get("expression"), str):
-            out["expression"] = data["expression"]
-        if isinstance(data.get("auto_cycle"), bool):
-            out["auto_cycle"] = data["auto_cycle"]
-
-        intensity = data.get("intensity")
-        if isinstance(intensity, (int, float)) and intensity == intensity:
-            out["intensity"] = max(0.0, min(1.0, float(intensity)))
-
-        look = data.get("look")
-        if isinstance(look, dict):
-            x = look.get("x")
-            y = look.get("y")
-            if isinstance(x, (int, float)) and isinstance(y, (int, float)) and x == x and y == y:
-                out["look"] = {
-                    "x": max(-1.0, min(1.0, float(x))),
-                    "y": max(-1.0, min(1.0, float(y))),
-                }
-
-        blink_seq = data.get("blink_seq")
-        if isinstance(blink_seq, (int, float)) and blink_seq == blink_seq:
-            out["blink_seq"] = int(blink_seq)
-
-        seq = data.get("sequence")
-        if isinstance(seq, str):
-            out["sequence"] = seq
-        seq_seq = data.get("sequence_seq")
-        if isinstance(seq_seq, (int, float)) and seq_seq == seq_seq:
-            out["sequence_seq"] = int(seq_seq)
+        for key, clean in _COMMAND_FIELDS:
+            value = data.get(key)
+            if value is not None:
+                value = clean(value)
+                if value is not None:
+                    out[key] = value
     return out
 
 
+# Encoded bodies keyed on path, valid while (st_ino, st_mtime_ns, st_size) is unchanged.
+_body_cache: dict[Path, tuple[tuple[int, int, int] | None, bytes]] = {}
+
+
+def _cached_body(path: Path, read) -> bytes:
+    """Return the encoded JSON of read(), re-reading only when *path* changes."""
+    try:
+        st = os.stat(path)
+        key = (st.st_ino, st.st_mtime_ns, st.st_size)
+    except OSError:
+        key = None
+    hit = _body_cache.get(path)
+    if hit is not None and hit[0] == key:
+        return hit[1]
+    body = _json.dumps(read())
+    _body_cache[path] = (key, body)
+    return body
+
+
+def _status_json() -> bytes:
+    return _cached_body(STATUS_FILE, _read_status_data)
+
+
+def _command_json() -> bytes:
+    return _cached_body(COMMAND_FILE, _read_command_data)
+
+
 # ────────────────────────────────────────────────────────────
 # SSE Broker — watches files, broadcasts changes to clients
 # ────────────────────────────────────────────────────────────
@@ -116,11 +174,11 @@ class SSEBroker:
         q: queue.Queue = queue.Queue(maxsize=32)
         # Push current state immediately so client doesn't wait
         try:
-            q.put_nowait(("status", json.dumps(_read_status_data())))
+            q.put_nowait(("status", _status_json().decode()))
         except queue.Full:
             pass
         try:
-            q.put_nowait(("command", json.dumps(_read_command_data())))
+            q.put_nowait(("command", _command_json().decode()))
         except queue.Full:
             pass
         with self._lock:
@@ -155,13 +213,13 @@ class SSEBroker:
             mt = self._stat_mtime(STATUS_FILE)
             if mt != self._status_mtime:
                 self._status_mtime = mt
-                self._broadcast("status", json.dumps(_read_status_data()))
+                self._broadcast("status", _status_json().decode())
                 changed = True
 
             mt = self._stat_mtime(COMMAND_FILE)
             if mt != self._command_mtime:
                 self._command_mtime = mt
-                self._broadcast("command", json.dumps(_read_command_data()))
+                self._broadcast("command", _command_json().decode())
                 changed = True
 
             if not changed:
@@ -179,11 +237,14 @@ class SSEBroker:
 class ClawFaceHandler(SimpleHTTPRequestHandler):
     """Request handler with API endpoints and static file serving."""
 
+    protocol_version = "HTTP/1.1"  # keep-alive; every response sets Content-Length
     webview_window = None  # Set by _run_webview when in webview mode
+    config: Config  # Bound per server by _start_server
+    config_json: bytes  # Pre-encoded /api/config body, see _config_json
+    static_files: dict[str, tuple[bytes, str, str]] = {}  # See _load_static
 
-    def __init__(self, *args, config: Config, **kwargs):
-        self.config = config
-        super().__init__(*args, directory=str(WEB_DIR), **kwargs)
+    def __init__(self, *args):
+        super().__init__(*args, directory=_WEB_DIR_STR)
 
     def _require_loopback(self) -> bool:
         ip = ""
@@ -194,31 +255,46 @@ class ClawFaceHandler(SimpleHTTPRequestHandler):
         if _is_loopback_address(ip):
             return True
         self.send_response(HTTPStatus.FORBIDDEN)
-        body = json.dumps({"ok": False, "error": "forbidden"}).encode()
+        body = _json.dumps({"ok": False, "error": "forbidden"})
         self.send_header("Content-Type", "application/json")
         self.send_header("Content-Length", str(len(body)))
-        self.end_headers()
-        self.wfile.write(body)
+        self._end_headers_with(body)
         return False
 
+    _ROUTES = {
+        "/api/status": "_handle_status",
+        "/api/command": "_handle_command",
+        "/api/config": "_handle_config",
+        "/api/expressions": "_handle_expressions",
+        "/api/events": "_handle_events",
+        "/api/fullscreen/toggle": "_handle_fullscreen_toggle",
+        "/api/quit": "_handle_quit",
+    }
+
     def do_GET(self):
-        if self.path == "/api/status":
-            self._handle_status()
-        elif self.path == "/api/command":
-            self._handle_command()
-        elif self.path == "/api/config":
-            self._handle_config()
-        elif self.path == "/api/expressions":
-            self._handle_expressions()
-        elif self.path == "/api/events":
-            self._handle_events()
-        elif self.path == "/api/fullscreen/toggle":
-            self._handle_fullscreen_toggle()
-        elif self.path == "/api/quit":
-            self._handle_quit()
+        path = self.path.partition("?")[0]  # e.g. cache-busting "/?v=2"
+        handler = self._ROUTES.get(path)
+        if handler is not None:
+            getattr(self, handler)()
+            return
+        static = self.static_files.get(path)
+        if static is not None:
+            self._static_response(*static)
         else:
             super().do_GET()
 
+    def _static_response(self, body: bytes, content_type: str, etag: str):
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(HTTPStatus.NOT_MODIFIED)
+            self.send_header("ETag", etag)
+            self.end_headers()
+            return
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", etag)
+        self._end_headers_with(body)
+
     def _handle_quit(self):
         if not self._require_loopback():
             return
@@ -231,33 +307,23 @@ class ClawFaceHandler(SimpleHTTPRequestHandler):
             threading.Thread(target=self.server.shutdown, daemon=True).start()
 
     def _handle_status(self):
-        self._json_response(_read_status_data())
+        self._raw_json_response(_status_json())
 
     def _handle_command(self):
-        self._json_response(_read_command_data())
+        self._raw_json_response(_command_json())
 
     def _handle_config(self):
-        from dataclasses import asdict
-
-        data = {
-            "behavior": asdict(self.config.behavior),
-            "colors": {
-                k: list(v) if isinstance(v, tuple) else v
-                for k, v in asdict(self.config.colors).items()
-            },
-            "display": asdict(self.config.display),
-        }
-        self._json_response(data)
+        self._raw_json_response(self.config_json)
 
     def _handle_expressions(self):
         from .expressions import CANONICAL, COMPAT_MAP, SPECIAL, WEIGHTS
 
         self._json_response(
             {
-                "canonical": CANONICAL,
-                "compat": COMPAT_MAP,
-                "special": SPECIAL,
-                "weights": WEIGHTS,
+                "canonical": list(CANONICAL),
+                "compat": dict(COMPAT_MAP),
+                "special": list(SPECIAL),
+                "weights": dict(WEIGHTS),
             }
         )
 
@@ -273,6 +339,8 @@ class ClawFaceHandler(SimpleHTTPRequestHandler):
         self.send_header("Cache-Control", "no-cache")
         self.send_header("Connection", "keep-alive")
         self.end_headers()
+        # The stream has no Content-Length; don't try to reuse the socket afterwards.
+        self.close_connection = True
 
         q = broker.subscribe()
         try:
@@ -307,21 +375,63 @@ class ClawFaceHandler(SimpleHTTPRequestHandler):
         self._json_response({"ok": ok})
 
     def _json_response(self, data):
-        body = json.dumps(data).encode()
+        self._raw_json_response(_json.dumps(data))
+
+    def _raw_json_response(self, body: bytes):
         self.send_response(HTTPStatus.OK)
         self.send_header("Content-Type", "application/json")
         self.send_header("Content-Length", str(len(body)))
-        self.end_headers()
-        self.wfile.write(body)
+        self._end_headers_with(body)
+
+    def _end_headers_with(self, body: bytes):
+        """end_headers() followed by *body*, sent to the socket in one write."""
+        if self.request_version == "HTTP/0.9":  # no headers at all, just the body
+            self.wfile.write(body)
+            return
+        self._headers_buffer.append(b"\r\n")
+        self._headers_buffer.append(body)
+        self.flush_headers()
 
     def log_message(self, format, *args):
         # Suppress per-request logging for clean terminal
         pass
 
 
+def _config_json(config: Config) -> bytes:
+    """Encode the /api/config payload once; config does not change while serving."""
+    return _json.dumps(config.to_dict())
+
+
+def _load_static(web_dir: Path) -> dict[str, tuple[bytes, str, str]]:
+    """Read the web assets once: URL path -> (body, content type, ETag)."""
+    import hashlib
+    import mimetypes
+
+    files = {}
+    for path in sorted(web_dir.rglob("*")):
+        if not path.is_file():
+            continue
+        body = path.read_bytes()
+        ctype = mimetypes.guess_type(path.name)[0] or "application/octet-stream"
+        etag = f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+        files["/" + path.relative_to(web_dir).as_posix()] = (body, ctype, etag)
+    if "/index.html" in files:
+        files["/"] = files["/index.html"]
+    return files
+
+
 def _start_server(config, port):
     """Create and return a ThreadingHTTPServer, or None on failure."""
-    handler = partial(ClawFaceHandler, config=config)
+    # Bind config on a subclass so each request constructs the handler directly.
+    handler = type(
+        "BoundHandler",
+        (ClawFaceHandler,),
+        {
+            "config": config,
+            "config_json": _config_json(config),
+            "static_files": _load_static(WEB_DIR),
+        },
+    )
     host = getattr(config.display, "host", "127.0.0.1")
     try:
         server = ThreadingHTTPServer((host, port), handler)
@@ -404,6 +514,8 @@ def _run_webview(server, url, config: Config):
 
 def _run_browser(server, url):
     """Open in system browser and serve until Ctrl+C."""
+    import webbrowser
+
     print(f"Claw Face running at {url}")
     print("Press Ctrl+C to stop.")
     threading.Timer(0.5, webbrowser.open, args=[url]).start()
@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+import http.client
+import threading
+from collections.abc import Iterator
+
+import pytest
+
+from claw_face.config import Config
+from claw_face.server import _shutdown_server, _start_server
+
+
+@pytest.fixture(scope="session")
+def api_server() -> Iterator[tuple[str, int]]:
+    """One loopback server shared by every HTTP test; yields (host, port)."""
+    cfg = Config()
+    cfg.display.host = "127.0.0.1"
+    cfg.display.port = 0
+    cfg.validate()
+
+    server = _start_server(cfg, 0)
+    assert server is not None
+    # A short poll interval lets shutdown() at session end return almost immediately.
+    t = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True)
+    t.start()
+    try:
+        yield server.server_address[0], int(server.server_address[1])
+    finally:
+        server.shutdown()
+        _shutdown_server(server)
+        t.join(timeout=2)
+
+
+@pytest.fixture(scope="session")
+def api_conn(api_server) -> Iterator[http.client.HTTPConnection]:
+    """Keep-alive connection to api_server, reused by every test that asks for it."""
+    host, port = api_server
+    conn = http.client.HTTPConnection(host, port, timeout=2)
+    try:
+        yield conn
+    finally:
+        conn.close()
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
 import json
+from dataclasses import asdict
 from pathlib import Path
 
-from claw_face.config import Config
+from claw_face.config import Config, clear_load_cache
 
 
 def test_unknown_keys_ignored(tmp_path: Path) -> None:
@@ -46,3 +47,91 @@ def test_validation_clamps_and_normalizes(tmp_path: Path) -> None:
     assert 0 <= cfg.display.port <= 65535
     assert cfg.display.window_width >= 1
     assert cfg.display.window_height >= 1
+
+
+def test_load_is_memoized_until_file_changes(tmp_path: Path) -> None:
+    p = tmp_path / "config.json"
+    p.write_text(json.dumps({"display": {"fps": 30}}))
+    first = Config.load(p)
+    first.display.fps = 5  # callers get copies; the cache stays pristine
+    assert Config.load(p).display.fps == 30
+
+    p.write_text(json.dumps({"display": {"fps": 120}, "behavior": {}}))
+    assert Config.load(p).display.fps == 120
+
+
+def test_save_load_roundtrip(tmp_path: Path) -> None:
+    p = tmp_path / "config.json"
+    cfg = Config()
+    cfg.colors.eye_color = (10, 20, 30)
+    cfg.display.fps = 45
+    cfg.save(p)
+    assert json.loads(p.read_text())["colors"]["eye_color"] == [10, 20, 30]
+
+    clear_load_cache()
+    loaded = Config.load(p)
+    assert loaded.colors.eye_color == (10, 20, 30)
+    assert loaded.display.fps == 45
+
+
+def test_missing_file_returns_defaults_quietly(tmp_path: Path, caplog) -> None:
+    cfg = Config.load(tmp_path / "nope.json")
+    assert cfg.display.port == 8420
+    assert not caplog.records
+
+
+def test_to_dict_matches_asdict() -> None:
+    cfg = Config()
+    expected = asdict(cfg)
+    expected["colors"] = {
+        k: list(v) if isinstance(v, tuple) else v for k, v in expected["colors"].items()
+    }
+    assert cfg.to_dict() == expected
+    assert json.loads(json.dumps(cfg.to_dict())) == expected
+
+
+def test_unvalidated_save_is_not_served_from_cache(tmp_path: Path) -> None:
+    clear_load_cache()
+    path = tmp_path / "config.json"
+    cfg = Config()
+    cfg.display.fps = 999
+    cfg.colors.eye_color = [1, 2, 3]  # type: ignore[assignment]
+    cfg.save(path, validate=False)
+
+    loaded = Config.load(path)
+    assert loaded.display.fps == 240
+    assert loaded.colors.eye_color == (1, 2, 3)
+
+
+def test_nan_field_is_clamped_not_fatal(tmp_path: Path) -> None:
+    clear_load_cache()
+    path = tmp_path / "config.json"
+    path.write_text('{"behavior": {"blink_interval_min": NaN}, "display": {"fps": 20}}')
+
+    cfg = Config.load(path)
+    assert cfg.behavior.blink_interval_min == 3.0
+    assert cfg.display.fps == 20
+
+
+def test_load_after_save_matches_fresh_parse(tmp_path: Path) -> None:
+    clear_load_cache()
+    path = tmp_path / "config.json"
+    cfg = Config()
+    cfg.behavior.blink_interval_max = float("inf")  # orjson writes this as null
+    cfg.save(path)
+
+    cached = Config.load(path)
+    clear_load_cache()
+    assert Config.load(path) == cached
+
+
+def test_infinite_interval_falls_back(tmp_path: Path) -> None:
+    clear_load_cache()
+    path = tmp_path / "config.json"
+    path.write_text('{"behavior": {"blink_interval_max": 1e999}}')
+
+    cfg = Config.load(path)
+    assert cfg.behavior.blink_interval_max == 6.0
+    cfg.save(path)
+    clear_load_cache()
+    assert Config.load(path).behavior.blink_interval_max == 6.0
@@ -0,0 +1,211 @@
+from __future__ import annotations
+
+import signal
+from types import SimpleNamespace
+
+import pytest
+
+import claw_face.idle as idle
+from claw_face.idle import IdleDaemon, Settings
+
+
+class FakeGLib:
+    """Mirrors the PyGObject call signatures IdleDaemon relies on."""
+
+    PRIORITY_HIGH = -100
+    PRIORITY_DEFAULT = 0
+    PRIORITY_LOW = 300
+    SOURCE_REMOVE = False
+
+    def __init__(self) -> None:
+        self.timeouts: dict[int, tuple[int, object, int]] = {}
+        self.removed: list[int] = []
+        self.signals: list[tuple[int, int]] = []
+        self.signal_handlers: dict[int, object] = {}
+        self.child_watches: dict[int, object] = {}
+        self._next_id = 0
+
+    def _add(self, entry) -> int:
+        self._next_id += 1
+        self.timeouts[self._next_id] = entry
+        return self._next_id
+
+    def timeout_add_seconds(self, interval, function, *user_data, priority=PRIORITY_DEFAULT):
+        if not callable(function):
+            raise TypeError(f"Callback needs to be a function or method not {type(function)}")
+        return self._add((int(interval), function, priority))
+
+    def idle_add(self, function, *user_data, priority=PRIORITY_DEFAULT):
+        if not callable(function):
+            raise TypeError("Callback needs to be a function or method")
+        return self._add((0, function, priority))
+
+    def child_watch_add(self, priority, pid, function, *user_data):
+        assert callable(function)
+        self.child_watches[pid] = function
+        return self._add((0, function, priority))
+
+    def unix_signal_add(self, priority, signum, handler):
+        assert callable(handler)
+        self.signals.append((priority, signum))
+        self.signal_handlers[signum] = handler
+        return self._add((0, handler, priority))
+
+    def source_remove(self, source_id: int) -> bool:
+        self.removed.append(source_id)
+        return self.timeouts.pop(source_id, None) is not None
+
+    @staticmethod
+    def Variant(fmt, value):
+        return (fmt, value)
+
+    @staticmethod
+    def MainLoop():
+        return SimpleNamespace(run=lambda: None, quit=lambda: None)
+
+
+class FakeProxy:
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, object]] = []
+
+    def call_sync(self, method, params, flags, timeout, cancellable):
+        return SimpleNamespace(unpack=lambda: (0,))  # watch id 0, screensaver inactive
+
+    def call(self, method, params, *args) -> None:
+        self.calls.append((method, params))
+
+    def connect(self, signal, handler) -> int:
+        return 1
+
+
+@pytest.fixture
+def fake_glib(monkeypatch) -> FakeGLib:
+    glib = FakeGLib()
+    gio = SimpleNamespace(
+        BusType=SimpleNamespace(SESSION=0),
+        DBusCallFlags=SimpleNamespace(NONE=0),
+        DBusProxyFlags=SimpleNamespace(DO_NOT_LOAD_PROPERTIES=1, DO_NOT_CONNECT_SIGNALS=2),
+        DBusProxy=SimpleNamespace(new_for_bus_sync=lambda *args: FakeProxy()),
+    )
+    monkeypatch.setattr(idle, "GLib", glib)
+    monkeypatch.setattr(idle, "Gio", gio)
+    return glib
+
+
+def _settings(night: bool) -> Settings:
+    return Settings(
+        idle_seconds=60,
+        face_port=0,
+        face_args=[],
+        screen_off=(22, 0) if night else None,
+        screen_on=(7, 0) if night else None,
+    )
+
+
+def test_run_registers_timers_with_pygobject_signatures(fake_glib: FakeGLib) -> None:
+    daemon = IdleDaemon(_settings(night=True))
+    assert daemon.run() == 0
+
+    by_callback = {cb: (interval, prio) for interval, cb, prio in fake_glib.timeouts.values()}
+    assert by_callback[daemon._prewarm_face] == (30, FakeGLib.PRIORITY_LOW)
+    interval, prio = by_callback[daemon._on_transition]
+    assert 1 <= interval <= 86400
+    assert prio == FakeGLib.PRIORITY_DEFAULT
+    assert len(fake_glib.signals) == 2
+
+
+def test_sigint_runs_stop(fake_glib: FakeGLib, monkeypatch) -> None:
+    class SigintLoop:
+        """MainLoop.run() that receives SIGINT the way PyGObject handles it."""
+
+        def run(self) -> None:
+            if signal.getsignal(signal.SIGINT) is signal.default_int_handler:
+                # PyGObject's fallback handler only quits the loop (then raises
+                # KeyboardInterrupt); the GLib source never dispatches.
+                return
+            fake_glib.signal_handlers[signal.SIGINT]()
+
+        def quit(self) -> None:
+            pass
+
+    monkeypatch.setattr(fake_glib, "MainLoop", SigintLoop)
+    old_handler = signal.signal(signal.SIGINT, signal.default_int_handler)
+    try:
+        daemon = IdleDaemon(_settings(night=False))
+        assert daemon.run() == 0
+    finally:
+        signal.signal(signal.SIGINT, old_handler)
+    assert daemon._exiting
+
+
+def test_schedule_transition_replaces_pending_timer(fake_glib: FakeGLib) -> None:
+    daemon = IdleDaemon(_settings(night=True))
+    daemon._schedule_transition()
+    first = daemon._transition_timer_id
+    daemon._schedule_transition()
+    assert fake_glib.removed == [first]
+    assert daemon._transition_timer_id in fake_glib.timeouts
+
+
+def test_no_transition_timer_without_night_schedule(fake_glib: FakeGLib) -> None:
+    daemon = IdleDaemon(_settings(night=False))
+    daemon._schedule_transition()
+    assert daemon._transition_timer_id is None
+
+
+def test_repeated_dpms_off_is_sent_once_until_a_watch_fires(fake_glib: FakeGLib) -> None:
+    daemon = IdleDaemon(_settings(night=True))
+    display = daemon._display_config
+    daemon._dpms_off()
+    daemon._do_rearm()
+    daemon._dpms_off()
+    assert [m for m, _ in display.calls] == ["Set"]
+
+    daemon._on_idle_signal(None, None, "WatchFired", SimpleNamespace(unpack=lambda: (99,)))
+    daemon._dpms_off()
+    assert [m for m, _ in display.calls] == ["Set", "Set"]
+
+
+def test_is_night_is_memoized_per_minute(fake_glib: FakeGLib, monkeypatch) -> None:
+    monkeypatch.setattr(idle, "time", SimpleNamespace(time=lambda: 1_000_000.0))
+    daemon = IdleDaemon(_settings(night=True))
+    first = daemon._is_night()
+    assert daemon._night_cache == (1_000_000 // 60, first)
+    daemon._do_rearm()
+    assert daemon._night_cache[1] is first  # re-arming keeps the memo
+
+    monkeypatch.setattr(idle, "datetime", None)  # a cache miss would now fail
+    assert daemon._is_night() is first
+
+
+class FakePopen:
+    """A child process that must never be waited on by subprocess itself."""
+
+    def __init__(self, argv, **kwargs) -> None:
+        self.pid = 4242
+        self.returncode = None
+
+    def poll(self):
+        raise AssertionError("GLib owns reaping; Popen.poll() must not be called")
+
+    wait = terminate = poll
+
+
+def test_face_process_is_tracked_by_glib_child_watch(fake_glib: FakeGLib, monkeypatch) -> None:
+    killed: list[tuple[int, int]] = []
+    monkeypatch.setattr(idle.subprocess, "Popen", FakePopen)
+    monkeypatch.setattr(idle.os, "kill", lambda pid, sig: killed.append((pid, sig)))
+    daemon = IdleDaemon(_settings(night=False))
+
+    daemon._start_face_if_needed()
+    proc = daemon._face_proc
+    assert isinstance(proc, FakePopen)
+    daemon._start_face_if_needed()  # still running: no second launch
+    assert daemon._face_proc is proc
+
+    daemon._kill_face()
+    assert killed == [(4242, idle.signal.SIGTERM)]
+
+    fake_glib.child_watches[4242](4242, 0)  # GLib reaped it
+    assert daemon._face_proc is None
+    assert proc.returncode == 0
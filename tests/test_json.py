@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+import json
+import math
+
+from claw_face import _json
+
+
+def test_loads_accepts_non_standard_literals() -> None:
+    data = _json.loads(b'{"x": NaN, "y": Infinity}')
+    assert math.isnan(data["x"])
+    assert data["y"] == math.inf
+
+
+def test_dumps_handles_wide_integers() -> None:
+    obj = {"n": 2**70}
+    assert json.loads(_json.dumps(obj)) == obj
+    assert json.loads(_json.dumps(obj, indent=True)) == obj
+
+
+def test_dumps_indent() -> None:
+    assert _json.dumps({"a": 1}, indent=True) == b'{\n  "a": 1\n}'
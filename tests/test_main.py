@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import subprocess
+import sys
+
+import pytest
+
+from claw_face import __version__
+from claw_face.main import _parse_simple, parse_args
+
+
+def test_version_fast_path_skips_argparse_and_config() -> None:
+    code = (
+        "import sys; sys.argv = ['claw-face', '--version']\n"
+        "from claw_face.main import main\n"
+        "assert main() == 0\n"
+        "assert 'argparse' not in sys.modules\n"
+        "assert 'claw_face.config' not in sys.modules\n"
+    )
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert out.stdout.strip() == f"Claw Face {__version__}"
+
+
+@pytest.mark.parametrize(
+    "argv",
+    [
+        [],
+        ["--headless", "--port", "0"],
+        ["--browser", "--host=0.0.0.0", "--fps", "20", "-c", "cfg.json"],
+        ["--windowed", "--width", "800", "--height=600", "--log-level", "debug"],
+        ["--save-config"],
+    ],
+)
+def test_simple_parser_matches_argparse(argv: list[str]) -> None:
+    fast = _parse_simple(argv)
+    assert fast is not None
+    assert vars(fast) == vars(parse_args(argv))
+
+
+@pytest.mark.parametrize(
+    "argv",
+    [
+        ["--help"],
+        ["--head"],
+        ["--port", "abc"],
+        ["--port"],
+        ["--browser", "--headless"],
+        ["--save-config=yes"],
+        ["extra"],
+    ],
+)
+def test_simple_parser_defers_unusual_input_to_argparse(argv: list[str]) -> None:
+    assert _parse_simple(argv) is None
@@ -1,93 +1,176 @@
 from __future__ import annotations
 
 import json
-import threading
-import urllib.request
+import socket
+import subprocess
+import sys
 
-from claw_face.config import Config
-from claw_face.server import _is_loopback_address, _start_server
+import pytest
 
+from claw_face.server import _is_loopback_address
 
-def test_is_loopback_address() -> None:
-    assert _is_loopback_address("127.0.0.1") is True
-    assert _is_loopback_address("::1") is True
-    assert _is_loopback_address("192.168.0.1") is False
-    assert _is_loopback_address("not-an-ip") is False
+try:
+    from orjson import loads
+except ImportError:  # optional speedup; stdlib json works everywhere
+    from json import loads
 
+# Raw command.json payload for the endpoint smoke test, encoded once at import.
+_COMMAND_JSON_BYTES = json.dumps(
+    {
+        "expression": "thinking",
+        "auto_cycle": False,
+        "intensity": 2.5,  # clamp -> 1.0
+        "look": {"x": -2, "y": 0.25},  # clamp x -> -1.0
+        "blink_seq": 123.9,  # int -> 123
+        "sequence": "boot",
+        "sequence_seq": 7,
+        "unknown": True,
+        "look_bad": {"x": "no", "y": []},
+    }
+).encode()
 
-def test_server_status_endpoint_works() -> None:
-    cfg = Config()
-    cfg.display.host = "127.0.0.1"
-    cfg.display.port = 0
-    cfg.validate()
 
-    server = _start_server(cfg, 0)
-    assert server is not None
-    t = threading.Thread(target=server.serve_forever, daemon=True)
-    t.start()
+@pytest.mark.parametrize(
+    ("addr", "expected"),
+    [
+        ("127.0.0.1", True),
+        ("::1", True),
+        ("192.168.0.1", False),
+        ("not-an-ip", False),
+    ],
+)
+def test_is_loopback_address(addr: str, expected: bool) -> None:
+    assert _is_loopback_address(addr) is expected
+
+
+def test_endpoints_smoke(api_conn, tmp_path) -> None:
+    # Patch the module-level command path to avoid touching the user's config dir.
+    import claw_face.server as server_mod
+
+    def get(path: str):
+        api_conn.request("GET", path)
+        resp = api_conn.getresponse()
+        body = resp.read()
+        assert resp.status == 200, path
+        assert resp.version == 11 and not resp.will_close, path  # connection kept alive
+        return body
+
+    orig_cmd = server_mod.COMMAND_FILE
     try:
-        host, port = server.server_address[0], int(server.server_address[1])
-        url = f"http://{host}:{port}/api/status"
-        with urllib.request.urlopen(url, timeout=2) as resp:
-            assert resp.status == 200
-            data = json.loads(resp.read().decode("utf-8"))
-            assert "text" in data
+        server_mod.COMMAND_FILE = tmp_path / "command.json"
+        server_mod.COMMAND_FILE.write_bytes(_COMMAND_JSON_BYTES)
+
+        data = loads(get("/api/status"))
+        assert "text" in data
+
+        data = loads(get("/api/command"))
+        assert data["expression"] == "thinking"
+        assert data["auto_cycle"] is False
+        assert data["intensity"] == 1.0
+        assert data["look"] == {"x": -1.0, "y": 0.25}
+        assert data["blink_seq"] == 123
+        assert data["sequence"] == "boot"
+        assert data["sequence_seq"] == 7
+        assert "unknown" not in data
+
+        data = loads(get("/api/config"))
+        assert set(data) == {"colors", "behavior", "display"}
+
+        get("/api/expressions")
+        get("/")
     finally:
-        server.shutdown()
-        server.server_close()
-        t.join(timeout=2)
+        server_mod.COMMAND_FILE = orig_cmd
 
 
-def test_server_command_endpoint_v2_filters_and_clamps(tmp_path) -> None:
-    # Patch the module-level command path to avoid touching the user's config dir.
+def test_read_status_data_handles_missing_and_undecodable(tmp_path) -> None:
+    import claw_face.server as server_mod
+
+    orig_status = server_mod.STATUS_FILE
+    try:
+        server_mod.STATUS_FILE = tmp_path / "status.txt"
+        assert server_mod._read_status_data() == {"text": ""}
+
+        server_mod.STATUS_FILE.write_bytes(b"  Working \xff\n")
+        assert server_mod._read_status_data() == {"text": "Working �"}
+    finally:
+        server_mod.STATUS_FILE = orig_status
+
+
+def test_server_import_skips_window_modules() -> None:
+    code = (
+        "import sys\n"
+        "import claw_face.server\n"
+        "assert 'webbrowser' not in sys.modules\n"
+        "assert 'webview' not in sys.modules\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_status_body_is_cached_until_file_changes(tmp_path) -> None:
+    import claw_face.server as server_mod
+
+    orig_status = server_mod.STATUS_FILE
+    try:
+        server_mod.STATUS_FILE = tmp_path / "status.txt"
+        assert loads(server_mod._status_json()) == {"text": ""}
+
+        server_mod.STATUS_FILE.write_text("Idle")
+        first = server_mod._status_json()
+        assert loads(first) == {"text": "Idle"}
+        assert server_mod._status_json() is first
+
+        server_mod.STATUS_FILE.write_text("Working")
+        assert loads(server_mod._status_json()) == {"text": "Working"}
+    finally:
+        server_mod.STATUS_FILE = orig_status
+
+
+def test_static_index_served_from_memory_with_etag(api_conn) -> None:
+    api_conn.request("GET", "/")
+    resp = api_conn.getresponse()
+    assert resp.status == 200
+    assert resp.headers["Content-Type"] == "text/html"
+    etag = resp.headers["ETag"]
+    assert b"<html" in resp.read().lower()
+
+    api_conn.request("GET", "/", headers={"If-None-Match": etag})
+    resp = api_conn.getresponse()
+    assert resp.status == 304
+    assert resp.read() == b""
+
+
+def test_command_json_tolerates_nan_and_huge_numbers(tmp_path) -> None:
     import claw_face.server as server_mod
 
     orig_cmd = server_mod.COMMAND_FILE
     try:
         server_mod.COMMAND_FILE = tmp_path / "command.json"
         server_mod.COMMAND_FILE.write_text(
-            json.dumps(
-                {
-                    "expression": "thinking",
-                    "auto_cycle": False,
-                    "intensity": 2.5,  # clamp -> 1.0
-                    "look": {"x": -2, "y": 0.25},  # clamp x -> -1.0
-                    "blink_seq": 123.9,  # int -> 123
-                    "sequence": "boot",
-                    "sequence_seq": 7,
-                    "unknown": True,
-                    "look_bad": {"x": "no", "y": []},
-                }
-            )
+            '{"expression": "happy", "intensity": NaN, "blink_seq": 1e30}'
         )
-
-        cfg = Config()
-        cfg.display.host = "127.0.0.1"
-        cfg.display.port = 0
-        cfg.validate()
-
-        server = _start_server(cfg, 0)
-        assert server is not None
-        t = threading.Thread(target=server.serve_forever, daemon=True)
-        t.start()
-        try:
-            host, port = server.server_address[0], int(server.server_address[1])
-            url = f"http://{host}:{port}/api/command"
-            with urllib.request.urlopen(url, timeout=2) as resp:
-                assert resp.status == 200
-                data = json.loads(resp.read().decode("utf-8"))
-
-            assert data["expression"] == "thinking"
-            assert data["auto_cycle"] is False
-            assert data["intensity"] == 1.0
-            assert data["look"] == {"x": -1.0, "y": 0.25}
-            assert data["blink_seq"] == 123
-            assert data["sequence"] == "boot"
-            assert data["sequence_seq"] == 7
-            assert "unknown" not in data
-        finally:
-            server.shutdown()
-            server.server_close()
-            t.join(timeout=2)
+        data = json.loads(server_mod._command_json())
+        assert data == {"expression": "happy", "blink_seq": int(1e30)}
     finally:
         server_mod.COMMAND_FILE = orig_cmd
+
+
+def test_query_string_is_ignored_for_routing(api_conn) -> None:
+    api_conn.request("GET", "/api/status?t=123")
+    resp = api_conn.getresponse()
+    assert resp.status == 200
+    assert "text" in loads(resp.read())
+
+    api_conn.request("GET", "/?v=2")
+    resp = api_conn.getresponse()
+    assert resp.status == 200
+    assert resp.headers["ETag"]
+    resp.read()
+
+
+def test_http09_request_gets_bare_body(api_server) -> None:
+    with socket.create_connection(api_server, timeout=2) as sock:
+        sock.sendall(b"GET /api/status\r\n\r\n")  # no version: HTTP/0.9
+        chunks = []
+        while chunk := sock.recv(4096):
+            chunks.append(chunk)
+    assert "text" in loads(b"".join(chunks))